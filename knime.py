@@ -18,15 +18,43 @@ TODOs:
 
 
 import json
+import re
 import xml.etree.ElementTree as ElementTree
-from pathlib import Path, PurePosixPath
+from pathlib import Path
 import tempfile
 import subprocess
 import shlex
 import warnings
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    # Optional faster parsing of large workflows will be unavailable
+    lxml_etree = None
+try:
+    import orjson
+except ImportError:
+    # Optional faster (de)serialization of json will be unavailable
+    orjson = None
+try:
+    import ijson
+except ImportError:
+    # Optional streaming of large output tables will be unavailable
+    ijson = None
+else:
+    # Streaming relies upon the use_float option introduced in ijson 3.1
+    # and is only faster than loading whole files with ijson's C backend.
+    _ijson_version = re.match(r"(\d+)\.(\d+)", getattr(ijson, "__version__", ""))
+    if (
+            _ijson_version is None or
+            tuple(map(int, _ijson_version.groups())) < (3, 1) or
+            getattr(ijson, "backend", None) != "yajl2_c"
+       ):
+        ijson = None
 try:
     import requests
 except ImportError:
@@ -34,6 +62,7 @@ except ImportError:
     pass
 try:
     import pandas
+    import numpy
 except ImportError:
     # Optional support for returning pandas DataFrames will be unavailable
     pandas = None
@@ -45,7 +74,10 @@ __credits__ = [ "Davin Potts", "Greg Landrum" ]
 __version__ = "0.11.6"
 
 
-__all__ = [ "Workflow", "LocalWorkflow", "RemoteWorkflow", "executable_path" ]
+__all__ = [
+    "Workflow", "LocalWorkflow", "RemoteWorkflow", "BatchExecutorSession",
+    "executable_path",
+]
 
 
 if os.name == "nt":
@@ -56,30 +88,153 @@ else:
 
 KEYPHRASE_LOCKED = b"Workflow is locked by another KNIME instance"
 
+FACTORY_CONTAINER_TABLE_INPUT = \
+    "org.knime.json.node.container.input.table.ContainerTableInputNodeFactory"
+FACTORY_CONTAINER_TABLE_OUTPUT = \
+    "org.knime.json.node.container.output.table.ContainerTableOutputNodeFactory"
+# Used to cheaply rule out nodes which cannot be Container Table nodes.
+KEYPHRASE_CONTAINER_TABLE_INPUT = FACTORY_CONTAINER_TABLE_INPUT.encode("utf8")
+KEYPHRASE_CONTAINER_TABLE_OUTPUT = FACTORY_CONTAINER_TABLE_OUTPUT.encode("utf8")
+
+# Input tables with more rows than this are serialized in chunks of rows.
+JSON_CHUNK_NUM_ROWS = 10000
+
+
+def iterparse_xml(xml_filepath, events):
+    """Incrementally parses the specified XML file, yielding (event, element)
+    pairs like ElementTree.iterparse, using lxml when available and
+    otherwise the standard library's ElementTree.  The file is closed
+    even when iteration is abandoned early."""
+    with open(xml_filepath, "rb") as xml_fh:
+        if lxml_etree is not None:
+            # KNIME settings may embed very large values (e.g. example
+            # inputs) which libxml2 otherwise refuses to parse.
+            yield from lxml_etree.iterparse(
+                xml_fh,
+                events=events,
+                huge_tree=True
+            )
+        else:
+            yield from ElementTree.iterparse(xml_fh, events=events)
+
+
+def find_service_table_node_settings(settings_filepath):
+    """Returns a tuple containing the factory class name of the KNIME node
+    described by the specified settings.xml file and, for a Container Input
+    (Table) node, its parameter name setting.  Both are None when that node
+    cannot possibly be a Container Input or Output (Table) node."""
+
+    # Most nodes are not Container Table nodes; a bytes-level search of
+    # the (small) file rules those out without any decoding or parsing.
+    with open(settings_filepath, "rb") as fh:
+        settings_bytes = fh.read()
+    if (
+            settings_bytes.find(KEYPHRASE_CONTAINER_TABLE_INPUT) == -1 and
+            settings_bytes.find(KEYPHRASE_CONTAINER_TABLE_OUTPUT) == -1
+       ):
+        return None, None
+
+    # Stream through the XML once, picking up the parameterName entry of
+    # the first model config along the way to the node's factory entry,
+    # and stop as soon as both have been seen.
+    factory = None
+    parameter_name = None
+    depth = 0
+    model_config_state = None  # Becomes "open" and later "closed".
+    for event, elem in iterparse_xml(settings_filepath, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            key = elem.attrib.get("key")
+            if factory is None and key == "factory":
+                factory = elem.attrib.get("value", "")
+                if (
+                        factory != FACTORY_CONTAINER_TABLE_INPUT or
+                        model_config_state == "closed"
+                   ):
+                    break
+            elif depth == 2 and key == "model" and model_config_state is None:
+                model_config_state = "open"
+            elif (
+                    model_config_state == "open" and
+                    depth == 3 and
+                    key == "parameterName"
+                 ):
+                parameter_name = elem.attrib.get("value")
+            continue
+
+        if model_config_state == "open" and depth == 2:
+            model_config_state = "closed"  # Only the first is consulted.
+            if factory is not None:
+                break
+        depth -= 1
+        elem.clear()
+
+    if factory != FACTORY_CONTAINER_TABLE_INPUT:
+        parameter_name = None
+    return factory, parameter_name
 
-def find_service_table_node_dirnames(path_to_knime_workflow):
+
+def find_service_table_nodes(path_to_knime_workflow):
     """Returns a tuple containing the unique directory names of the Container
     Input and Output (Table) nodes employed by the KNIME workflow in the
-    specified path on disk.  The output tuple contains two lists, the first
+    specified path on disk, along with the parameter names of the Container
+    Input (Table) nodes.  The output tuple contains two lists, the first
     lists Container Input (Table) node directory names and the second lists
-    Container Output (Table) nodes."""
+    Container Output (Table) nodes, and a dict mapping each Container Input
+    (Table) node directory name to its parameter name setting."""
 
     input_service_table_node_dirnames = []
     output_service_table_node_dirnames = []
+    input_parameter_names = {}
+
+    node_dirnames, settings_filepaths = [], []
+    try:
+        with os.scandir(path_to_knime_workflow) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    settings_filepath = os.path.join(entry.path, "settings.xml")
+                    if os.path.isfile(settings_filepath):
+                        node_dirnames.append(entry.name)
+                        settings_filepaths.append(settings_filepath)
+    except (FileNotFoundError, NotADirectoryError):
+        pass  # As with an empty workflow, no nodes will be found.
+
+    if len(settings_filepaths) > 1:
+        # Scanning is I/O-bound, so overlap the reads of the many small
+        # settings.xml files (map() preserves the directory listing order).
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            node_settings = list(executor.map(
+                find_service_table_node_settings,
+                settings_filepaths
+            ))
+    else:
+        node_settings = [
+            find_service_table_node_settings(settings_filepath)
+            for settings_filepath in settings_filepaths
+        ]
+
+    for dirname, (factory, parameter_name) in zip(node_dirnames, node_settings):
+        if factory == FACTORY_CONTAINER_TABLE_INPUT:
+            input_service_table_node_dirnames.append(dirname)
+            input_parameter_names[dirname] = parameter_name
+        elif factory == FACTORY_CONTAINER_TABLE_OUTPUT:
+            output_service_table_node_dirnames.append(dirname)
+
+    return (
+        input_service_table_node_dirnames,
+        output_service_table_node_dirnames,
+        input_parameter_names,
+    )
 
-    for settings_filepath in Path(path_to_knime_workflow).glob("*/settings.xml"):
-        with settings_filepath.open() as fh:
-            for line in fh:
-                if "ContainerTableInputNodeFactory" in line:
-                    *extra, dirname, _settings_xml = settings_filepath.parts
-                    input_service_table_node_dirnames.append(dirname)
-                    break
-                elif "ContainerTableOutputNodeFactory" in line:
-                    *extra, dirname, _settings_xml = settings_filepath.parts
-                    output_service_table_node_dirnames.append(dirname)
-                    break
 
-    return input_service_table_node_dirnames, output_service_table_node_dirnames
+def find_service_table_node_dirnames(path_to_knime_workflow):
+    """Returns a tuple containing the unique directory names of the Container
+    Input and Output (Table) nodes employed by the KNIME workflow in the
+    specified path on disk.  The output tuple contains two lists, the first
+    lists Container Input (Table) node directory names and the second lists
+    Container Output (Table) nodes."""
+    return find_service_table_nodes(path_to_knime_workflow)[:2]
 
 
 def find_service_table_input_node_parameter_name(
@@ -88,107 +243,264 @@ def find_service_table_input_node_parameter_name(
 ):
     """Returns the unique-to-the-workflow parameter name setting from
     the specified Container Input (Table) Node."""
-    tree = ElementTree.parse(
-        Path(path_to_knime_workflow, unique_node_dirname, "settings.xml")
+    # Stream through settings.xml, stopping at the model config's
+    # parameterName entry instead of parsing the entire document.
+    depth = 0
+    in_model_config = False
+    for event, elem in iterparse_xml(
+            os.path.join(path_to_knime_workflow, unique_node_dirname, "settings.xml"),
+            events=("start", "end")
+        ):
+        if event == "start":
+            depth += 1
+            if depth == 2 and elem.attrib.get("key") == "model":
+                in_model_config = True
+            elif (
+                    in_model_config and
+                    depth == 3 and
+                    elem.attrib.get("key") == "parameterName"
+                 ):
+                return elem.attrib.get("value")
+            continue
+
+        if in_model_config and depth == 2:
+            break  # Only the first model config is consulted.
+        depth -= 1
+        elem.clear()
+
+    return None
+
+
+def find_node_ids(path_to_knime_workflow, unique_node_dirnames):
+    """Returns a dict mapping each of the supplied unique directory names
+    of KNIME nodes to their unique node ids, obtained from a single pass
+    through the workflow's workflow.knime file.  Directory names for which
+    no node could be found are absent from the returned dict."""
+
+    target_values = {
+        f"{dirname}/settings.xml": dirname
+        for dirname in unique_node_dirnames
+    }
+    node_ids = {}
+    if not target_values:
+        return node_ids
+
+    if lxml_etree is not None:
+        return find_node_ids_using_lxml(
+            os.path.join(path_to_knime_workflow, "workflow.knime"),
+            target_values
+        )
+
+    # Stream through workflow.knime, tracking nesting depth, so that the
+    # search can stop once all requested node configs have been seen
+    # instead of requiring that the entire document be parsed first.
+    depth = 0
+    nodes_depth = None
+    config_tag_name = None
+    node_id = None
+    found_dirname = None
+    for event, elem in iterparse_xml(
+            os.path.join(path_to_knime_workflow, "workflow.knime"),
+            events=("start", "end")
+        ):
+        if event == "start":
+            depth += 1
+            if nodes_depth is None:
+                if (
+                        depth == 2 and
+                        elem.attrib.get("key") == "nodes" and
+                        elem.tag.endswith("config")
+                   ):
+                    # Attempt to infer the namespace being used rather than
+                    # require one particular version of the KNIME XML
+                    # namespace.
+                    config_tag_name = elem.tag
+                    nodes_depth = depth
+            elif depth == nodes_depth + 2:
+                if elem.attrib.get("key") == "id":
+                    node_id = int(elem.attrib["value"])
+                value = elem.attrib.get("value")
+                if value in target_values:
+                    found_dirname = target_values[value]
+            continue
+
+        if nodes_depth is not None:
+            if depth == nodes_depth + 1 and elem.tag == config_tag_name:
+                if found_dirname is not None and node_id is not None:
+                    node_ids.setdefault(found_dirname, node_id)
+                    if len(node_ids) == len(target_values):
+                        return node_ids
+                node_id = found_dirname = None
+            elif depth == nodes_depth:
+                return node_ids
+        depth -= 1
+        elem.clear()
+
+    raise IndexError("nodes config XML tag not found")
+
+
+if lxml_etree is not None:
+    # Compiled once and evaluated per node with variable substitution.
+    # Matching on local-name() avoids requiring one particular version of
+    # the KNIME XML namespace.
+    lxml_nodes_config_xpath = lxml_etree.XPath(
+        "/*/*[local-name()='config' and @key='nodes']"
+    )
+    lxml_node_id_xpath = lxml_etree.XPath(
+        "*[local-name()='config' and *[@value=$settings_file]]"
+        "/*[@key='id']/@value"
     )
-    top_config = tree.getroot()
 
-    parameter_name = None
-    for config in top_config:
-        if config.attrib.get("key") == "model":
-            for entry in config:
-                if entry.attrib.get("key") == "parameterName":
-                    parameter_name = entry.attrib.get("value")
-                    break
-            break
 
-    return parameter_name
+def find_node_ids_using_lxml(workflow_knime_filepath, target_values):
+    """Variant of find_node_ids (requires lxml) which looks up each node
+    via precompiled XPath expressions.  The supplied `target_values` maps
+    the relative path to each node's settings.xml to its directory name."""
+
+    tree = lxml_etree.parse(
+        workflow_knime_filepath,
+        lxml_etree.XMLParser(huge_tree=True)
+    )
+    nodes_configs = lxml_nodes_config_xpath(tree)
+    if not nodes_configs:
+        raise IndexError("nodes config XML tag not found")
+
+    node_ids = {}
+    for target_value, dirname in target_values.items():
+        matched_ids = lxml_node_id_xpath(
+            nodes_configs[0],
+            settings_file=target_value
+        )
+        if matched_ids:
+            node_ids[dirname] = int(matched_ids[0])
+    return node_ids
 
 
-def find_node_id(path_to_knime_workflow, unique_node_dirname):
-    """Returns the unique node id for a KNIME node identified by its
-    unique directory name on disk.  For example, a Container Input (Table)
-    Node appearing in a KNIME workflow is given a unique directory name
-    on disk such as "Container Input _Table_ (#42)"."""
+# Maps a workflow's path to the modification time of its workflow.knime,
+# the node directory names looked up, and the node ids found for them.
+node_ids_cache = {}
 
-    tree = ElementTree.parse(Path(path_to_knime_workflow, "workflow.knime"))
-    top_config = tree.getroot()
 
-    for entry in top_config:
-        if entry.attrib.get("key") == "nodes" and entry.tag.endswith("config"):
-            # Attempt to infer the namespace being used rather than require
-            # one particular version of the KNIME XML namespace.
-            config_tag_name = entry.tag
-            break
-    else:
-        raise IndexError("nodes config XML tag not found")
+def find_node_ids_cached(path_to_knime_workflow, unique_node_dirnames):
+    """Same as find_node_ids but reuses the result from any previous call
+    for the same workflow and node directory names, provided that the
+    workflow's workflow.knime file has not been modified since."""
 
-    target_value = str(PurePosixPath(unique_node_dirname, "settings.xml"))
-    for node_config in entry.iterfind(config_tag_name):
-        for sub_tag in node_config:
-            if sub_tag.attrib.get("key") == "id":
-                node_id = int(sub_tag.attrib["value"])
-            if sub_tag.attrib.get("value") == target_value:
-                break
-        else:
-            node_id = None
-        if node_id is not None:
-            break
+    unique_node_dirnames = tuple(unique_node_dirnames)
+    if not unique_node_dirnames:
+        return {}
+
+    cache_key = str(path_to_knime_workflow)
+    mtime_ns = os.stat(
+        os.path.join(cache_key, "workflow.knime")
+    ).st_mtime_ns
+    cached = node_ids_cache.get(cache_key)
+    if cached is not None and cached[:2] == (mtime_ns, unique_node_dirnames):
+        return dict(cached[2])
 
-    return node_id
+    node_ids = find_node_ids(path_to_knime_workflow, unique_node_dirnames)
+    node_ids_cache[cache_key] = (mtime_ns, unique_node_dirnames, node_ids)
+    return dict(node_ids)
 
 
-map_numpy_to_knime_type = (
-    ('float', 'double'),
-    ('int64', 'long'),
-    ('long', 'long'),
-    ('int', 'int'),
-    ('bool', 'boolean')
-)
+def find_node_id(path_to_knime_workflow, unique_node_dirname):
+    """Returns the unique node id for a KNIME node identified by its
+    unique directory name on disk.  For example, a Container Input (Table)
+    Node appearing in a KNIME workflow is given a unique directory name
+    on disk such as "Container Input _Table_ (#42)"."""
+
+    return find_node_ids(
+        path_to_knime_workflow,
+        [unique_node_dirname]
+    ).get(unique_node_dirname)
+
+
+# Keyed by numpy's dtype.kind character, which pandas extension dtypes
+# (such as Int64 or boolean) also provide.  Integers which fit in 32 bits
+# are instead mapped to 'int' by pandas_type_mapper.
+map_numpy_kind_to_knime_type = {
+    'f': 'double',
+    'i': 'long',
+    'u': 'long',
+    'b': 'boolean',
+}
+
+# Output columns of these KNIME data types whose values are all of the
+# given Python type are built directly as arrays of the given numpy dtype,
+# the same dtype pandas would otherwise infer for them.
+map_knime_to_numpy_type = {
+    'double': (float, 'float64'),
+    'long': (int, 'int64'),
+    'int': (int, 'int64'),
+    'boolean': (bool, 'bool'),
+}
 
 def pandas_type_mapper(pandas_dtype):
     "Converts a pandas dtype to a comparable KNIME data type (as a string)."
-    key = str(pandas_dtype)
-    for np_type, knime_type in map_numpy_to_knime_type:
-        if np_type in key:
-            return knime_type
-    return 'string'
+    kind = getattr(pandas_dtype, "kind", None)
+    knime_type = map_numpy_kind_to_knime_type.get(kind, 'string')
+    if knime_type == 'long':
+        itemsize = getattr(pandas_dtype, "itemsize", 8)
+        if itemsize <= (4 if kind == 'i' else 2):
+            knime_type = 'int'
+    return knime_type
+
+
+def prepare_dataframe_for_knime(df):
+    """Returns the KNIME table spec (as a list of (column name, KNIME data
+    type) pairs) for a pandas DataFrame-like input.  Raises AttributeError
+    if the input is not DataFrame-like."""
+
+    return [
+        (column_name, pandas_type_mapper(dtype))
+        for column_name, dtype in df.dtypes.items()
+    ]
+
+
+def dataframe_has_missing_values(df):
+    """Returns True if any NaN (or otherwise missing) values exist in the
+    DataFrame, checking column by column and stopping at the first column
+    found to contain one rather than building a mask of the entire frame."""
+    return any(
+        df.iloc[:, i].isna().any()
+        for i in range(df.shape[1])
+    )
+
+
+def convert_dataframe_to_table_data(df, knime_types, *, has_missing_values):
+    """Returns the rows of a DataFrame as a list of lists, given the KNIME
+    data type of each of its columns.  If any NaN values exist, they are
+    replaced by None to ensure they convert to null in final json.  Each
+    column is converted on its own, so no column's data is "upcast" to a
+    type shared with other columns, and the DataFrame itself is never
+    modified."""
+    columns_values = []
+    for i, knime_type in enumerate(knime_types):
+        column = df.iloc[:, i]
+        if knime_type == "string":
+            # A column whose dtype does not readily map to a KNIME data
+            # type is conveyed to KNIME as str values.
+            column = column.apply(str)
+        elif has_missing_values and column.hasnans:
+            column = column.astype(object).where(column.notna(), None)
+        columns_values.append(column.tolist())
+    if not columns_values:
+        return [[] for _ in range(len(df))]
+    return list(map(list, zip(*columns_values)))
 
 
 def convert_dataframe_to_knime_friendly_dict(df):
     """Produces a dict from a pandas DataFrame-like input that is structured
-    to be friendly to KNIME when converted to then consumed as json.
-
-    Known issue:  Uses pandas.DataFrame.to_dict(orient="split") which will
-    make use of the values array rather than individual Series and as such
-    may cause "upcasting" of certain columns' data.  An example of this
-    would be a DataFrame containing only int64 and float64 columns.  The
-    output from to_dict(orient="split") will be a list of lists of float.
-    If upcasting is not possible, say in the same example a column is added
-    containing str's, then to_dict() will treat all as Python objects and
-    thus output a list of lists of int, float, str as appropriate.
-    """
+    to be friendly to KNIME when converted to then consumed as json."""
 
     try:
-        proto_table_spec = [
-            (column_name, pandas_type_mapper(dtype))
-            for column_name, dtype in df.dtypes.items()
-        ]
+        proto_table_spec = prepare_dataframe_for_knime(df)
 
-        # If an encountered column's dtype does not readily map to a KNIME
-        # data type, it will be conveyed to KNIME as a 'string'.  To ensure
-        # proper conversion to json, a copy of the original DataFrame is
-        # created, containing str values in otherwise problematic columns.
-        df2 = df.copy()
-        for column_name, knime_type in proto_table_spec:
-            if knime_type == "string":
-                df2[column_name] = df2[column_name].apply(str)
-
-        if df2.isna().any().any():
-            # If any NaN values exist, ensure they convert to null in final json.
-            cleaned_table_data = json.loads(df2.to_json(orient="values"))
-        else:
-            cleaned_table_data = df2.to_dict(orient="split")["data"]
+        cleaned_table_data = convert_dataframe_to_table_data(
+            df,
+            [t for _c, t in proto_table_spec],
+            has_missing_values=dataframe_has_missing_values(df)
+        )
         data = {
             "table-spec": [ {c: t} for c, t in proto_table_spec ],
             "table-data": cleaned_table_data,
@@ -200,6 +512,184 @@ def convert_dataframe_to_knime_friendly_dict(df):
     return data
 
 
+def convert_knime_columns_to_dataframe(table_spec, columns_values):
+    """Produces a pandas DataFrame from a KNIME table spec and the values
+    of each of its columns.  Columns whose KNIME data type has a numpy
+    equivalent are constructed directly as arrays of that type rather than
+    having pandas infer each column's dtype from Python objects.  Columns
+    holding missing values or values not matching their declared type are
+    left to pandas, exactly as before, so no value is silently coerced."""
+
+    # Each entry in the table-spec is a single-item dict of {name: type}.
+    df_columns = [next(iter(d)) for d in table_spec]
+    knime_types = [next(iter(d.values())) for d in table_spec]
+
+    columns_data = []
+    for knime_type, values in zip(knime_types, columns_values):
+        column_data = list(values)
+        python_type, numpy_type = map_knime_to_numpy_type.get(
+            knime_type,
+            (None, None)
+        )
+        if python_type is not None and set(map(type, column_data)) == {python_type}:
+            try:
+                column_data = numpy.asarray(column_data, dtype=numpy_type)
+            except OverflowError:
+                # Such as ints beyond 64 bits.
+                pass
+        columns_data.append(column_data)
+
+    df = pandas.DataFrame(dict(enumerate(columns_data)), copy=False)
+    df.columns = df_columns
+    return df
+
+
+def convert_knime_output_to_dataframe(output):
+    """Produces a pandas DataFrame from the output of a Container Output
+    (Table) node."""
+
+    table_data = output['table-data']
+    if not table_data:
+        df_columns = [next(iter(d)) for d in output['table-spec']]
+        return pandas.DataFrame(table_data, columns=df_columns)
+    return convert_knime_columns_to_dataframe(
+        output['table-spec'],
+        zip(*table_data)
+    )
+
+
+def load_knime_output_file_as_dataframe(json_filepath):
+    """Produces a pandas DataFrame from the json file written by a Container
+    Output (Table) node.  Rows are streamed from the file (requires ijson)
+    and gathered directly into columns rather than the entire table first
+    being held in memory as a list of rows."""
+
+    try:
+        with open(json_filepath, "rb") as json_fh:
+            table_spec = next(ijson.items(json_fh, "table-spec"), [])
+            json_fh.seek(0)
+            columns_values = tuple([] for _ in table_spec)
+            appenders = [column_values.append for column_values in columns_values]
+            num_rows = 0
+            for row in ijson.items(json_fh, "table-data.item", use_float=True):
+                for append, value in zip(appenders, row):
+                    append(value)
+                num_rows += 1
+    except ijson.JSONError:
+        # Such as for NaN or Infinity, which the json module tolerates.
+        return convert_knime_output_to_dataframe(load_json_file(json_filepath))
+
+    if not num_rows:
+        return convert_knime_output_to_dataframe(
+            {"table-spec": table_spec, "table-data": []}
+        )
+    return convert_knime_columns_to_dataframe(table_spec, columns_values)
+
+
+def dumps_json_as_bytes(data):
+    """Serializes the supplied data to json (as UTF-8 encoded bytes), using
+    orjson when available and otherwise the standard library's json."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            # Includes orjson.JSONEncodeError, e.g. for ints beyond 64 bits
+            # or non-str dict keys, which the standard library tolerates.
+            pass
+    return json.dumps(data).encode("utf8")
+
+
+def iter_dataframe_table_data_json(df, knime_types):
+    """Yields the json for the rows of a DataFrame, given the KNIME data
+    type of each of its columns, in successive chunks of rows, each without
+    the enclosing brackets, so that the json for the whole table never need
+    be held in memory at once."""
+
+    has_missing_values = dataframe_has_missing_values(df)
+    for start in range(0, len(df), JSON_CHUNK_NUM_ROWS):
+        yield dumps_json_as_bytes(
+            convert_dataframe_to_table_data(
+                df.iloc[start:start + JSON_CHUNK_NUM_ROWS],
+                knime_types,
+                has_missing_values=has_missing_values
+            )
+        )[1:-1]
+
+
+def iter_table_data_json(table_data):
+    """Yields the json for a list of rows in successive chunks of rows,
+    each without the enclosing brackets."""
+    for start in range(0, len(table_data), JSON_CHUNK_NUM_ROWS):
+        chunk = table_data[start:start + JSON_CHUNK_NUM_ROWS]
+        yield dumps_json_as_bytes(chunk)[1:-1]
+
+
+def write_knime_friendly_json(data, json_filepath):
+    """Writes the supplied input data table, either a dict already in KNIME's
+    required schema or a pandas DataFrame-like, as json to the specified
+    path for consumption by a Container Input (Table) node.  DataFrames and
+    other large tables are serialized in chunks of rows to bound the memory
+    required."""
+
+    try:
+        # Support pandas DataFrame-like inputs.
+        proto_table_spec = prepare_dataframe_for_knime(data)
+    except AttributeError:
+        table_data = data.get("table-data") if isinstance(data, dict) else None
+        if not (
+                isinstance(table_data, list) and
+                len(table_data) > JSON_CHUNK_NUM_ROWS
+           ):
+            with open(json_filepath, "wb") as json_fh:
+                json_fh.write(dumps_json_as_bytes(data))
+            return
+        other_data = {k: v for k, v in data.items() if k != "table-data"}
+        table_data_chunks = iter_table_data_json(table_data)
+    else:
+        other_data = {"table-spec": [ {c: t} for c, t in proto_table_spec ]}
+        table_data_chunks = iter_dataframe_table_data_json(
+            data,
+            [t for _c, t in proto_table_spec]
+        )
+
+    with open(json_filepath, "wb") as json_fh:
+        json_fh.write(dumps_json_as_bytes(other_data)[:-1])
+        json_fh.write(b',"table-data":[' if other_data else b'"table-data":[')
+        for i, chunk in enumerate(table_data_chunks):
+            if i:
+                json_fh.write(b",")
+            json_fh.write(chunk)
+        json_fh.write(b"]}")
+
+
+def loads_json_from_bytes(raw_json):
+    """Deserializes the supplied json (as UTF-8 encoded bytes), using
+    orjson when available and otherwise the standard library's json."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw_json)
+        except orjson.JSONDecodeError:
+            # The standard library tolerates some non-standard json, such
+            # as NaN and Infinity, which orjson rejects.
+            pass
+    return json.loads(raw_json)
+
+
+def load_json_file(json_filepath):
+    "Reads and deserializes the json file at the specified path."
+    with open(json_filepath, "rb") as json_fh:
+        return loads_json_from_bytes(json_fh.read())
+
+
+def read_captured_output(output_filepath):
+    """Returns the text of the KNIME stdout or stderr captured in the
+    specified file, or None if that output was not captured."""
+    if output_filepath is None:
+        return None
+    with open(output_filepath, "rb") as output_fh:
+        return output_fh.read().decode("utf8", errors="replace")
+
+
 def run_workflow_using_multiple_service_tables(
         input_datas,
         path_to_knime_executable,
@@ -208,6 +698,7 @@ def run_workflow_using_multiple_service_tables(
         output_service_table_node_ids,
         *,
         save_after_execution=False,
+        data_dir=None,
         live_passthru_stdout_stderr=False,
         output_as_pandas_dataframes=True if pandas else False,
         input_json_filename_pattern="input_%d.json",
@@ -215,7 +706,10 @@ def run_workflow_using_multiple_service_tables(
     ):
     """Executes the requested KNIME workflow, feeding the supplied data
     to the Container Input (Table) nodes in that workflow and returning the
-    output from the workflow's Container Output (Table) nodes."""
+    output from the workflow's Container Output (Table) nodes.  A supplied
+    `data_dir` is used as the KNIME workspace; otherwise, unless saving
+    after execution, a fresh one is created (and discarded) for this one
+    execution."""
 
     abspath_to_knime_workflow = Path(path_to_knime_workflow).resolve(strict=True)
     if not Path(path_to_knime_executable).exists():
@@ -224,90 +718,141 @@ def run_workflow_using_multiple_service_tables(
     with tempfile.TemporaryDirectory() as temp_dir:
         logging.debug(f"using temp dir: {temp_dir}")
 
-        option_flags_input_service_table_nodes = []
+        input_node_ids, input_json_filepaths, input_datas_to_write = [], [], []
         for node_id, data in zip(input_service_table_node_ids, input_datas):
             if data is None:
                 warnings.warn(f'No input set for node_id={node_id}', UserWarning)
                 continue
-
-            input_json_filename = input_json_filename_pattern % node_id
-            input_json_filepath = Path(temp_dir, input_json_filename)
-
-            # Support pandas DataFrame-like inputs.
-            data = convert_dataframe_to_knime_friendly_dict(data)
-
-            with open(input_json_filepath, "w") as input_json_fh:
-                json.dump(data, input_json_fh)
-
-            option_flags_input_service_table_nodes.append(
-                f'-option={node_id},inputPathOrUrl,"{input_json_filepath}",String'
-            )
-
-        option_flags_output_service_table_nodes = []
-        expected_output_json_files = []
-        for node_id in output_service_table_node_ids:
-            output_json_filename = output_json_filename_pattern % node_id
-            output_json_filepath = Path(temp_dir, output_json_filename)
-
-            option_flags_input_service_table_nodes.append(
-                f'-option={node_id},outputPathOrUrl,"{output_json_filepath}",String',
+            input_node_ids.append(node_id)
+            input_json_filepaths.append(
+                os.path.join(temp_dir, input_json_filename_pattern % node_id)
             )
-            expected_output_json_files.append(output_json_filepath)
+            input_datas_to_write.append(data)
+
+        if len(input_datas_to_write) > 1:
+            # Serialize and write the input json files concurrently.
+            with ThreadPoolExecutor(
+                    max_workers=min(len(input_datas_to_write), 8)
+                ) as executor:
+                list(executor.map(
+                    write_knime_friendly_json,
+                    input_datas_to_write,
+                    input_json_filepaths
+                ))
+        else:
+            for data, input_json_filepath in zip(
+                    input_datas_to_write,
+                    input_json_filepaths
+                ):
+                write_knime_friendly_json(data, input_json_filepath)
+
+        expected_output_json_files = [
+            os.path.join(temp_dir, output_json_filename_pattern % node_id)
+            for node_id in output_service_table_node_ids
+        ]
 
-        data_dir = Path(temp_dir, "knime_data")
+        option_flags_service_table_nodes = [
+            f'-option={node_id},inputPathOrUrl,{input_json_filepath},String'
+            for node_id, input_json_filepath
+            in zip(input_node_ids, input_json_filepaths)
+        ] + [
+            f'-option={node_id},outputPathOrUrl,{output_json_filepath},String'
+            for node_id, output_json_filepath
+            in zip(output_service_table_node_ids, expected_output_json_files)
+        ]
 
-        # shlex.quote handles executable paths containing spaces, etc.
-        # On Windows, cmd shell requires double-quotes, hence replace()
-        shell_command = " ".join([
-            shlex.quote(path_to_knime_executable).replace("'", '"'),
+        # Arguments are passed directly to the executable without a shell
+        # in between, so paths containing spaces, etc. need no quoting.
+        knime_command = [
+            str(path_to_knime_executable),
             "-nosplash",
             "-debug",
             "--launcher.suppressErrors",
-            "-application org.knime.product.KNIME_BATCH_APPLICATION",
-            f"-data {data_dir}" if not save_after_execution else "",
-            "-nosave" if not save_after_execution else "",
-            f'-workflowDir="{abspath_to_knime_workflow}"',
-            " ".join(option_flags_input_service_table_nodes),
-            " ".join(option_flags_output_service_table_nodes),
-        ])
-        logging.info(f"knime invocation: {shell_command}")
-
-        result = subprocess.run(
-            shell_command,
-            shell=True if os.name != "nt" else False,
-            stdout=subprocess.PIPE if not live_passthru_stdout_stderr else None,
-            stderr=subprocess.PIPE if not live_passthru_stdout_stderr else None,
+            "-application", "org.knime.product.KNIME_BATCH_APPLICATION",
+        ]
+        if save_after_execution:
+            # The workflow is saved in place; only a supplied workspace
+            # data directory (e.g. a BatchExecutorSession's) is passed on.
+            if data_dir is not None:
+                knime_command.extend(["-data", str(data_dir)])
+        else:
+            if data_dir is None:
+                data_dir = os.path.join(temp_dir, "knime_data")
+            knime_command.extend(["-data", str(data_dir), "-nosave"])
+        knime_command.append(f"-workflowDir={abspath_to_knime_workflow}")
+        knime_command.extend(option_flags_service_table_nodes)
+        logging.info(
+            "knime invocation: " +
+            " ".join(shlex.quote(arg) for arg in knime_command)
         )
+
+        if live_passthru_stdout_stderr:
+            stdout_filepath = stderr_filepath = None
+            result = subprocess.run(knime_command)
+        else:
+            # KNIME's (often verbose) output goes straight to files rather
+            # than being held in memory, and is only read back if needed.
+            stdout_filepath = os.path.join(temp_dir, "knime_stdout.log")
+            stderr_filepath = os.path.join(temp_dir, "knime_stderr.log")
+            with open(stdout_filepath, "wb") as stdout_fh, \
+                    open(stderr_filepath, "wb") as stderr_fh:
+                result = subprocess.run(
+                    knime_command,
+                    stdout=stdout_fh,
+                    stderr=stderr_fh,
+                )
         logging.info(f"exit code from KNIME execution: {result.returncode}")
 
-        knime_outputs = []
+        # When possible, DataFrames are built while streaming through the
+        # output files rather than after loading them entirely.
+        stream_outputs_to_dataframes = (
+            output_as_pandas_dataframes and
+            pandas is not None and
+            ijson is not None
+        )
+        load_output = (
+            load_knime_output_file_as_dataframe
+            if stream_outputs_to_dataframes else load_json_file
+        )
+
         try:
-            for output_json_filepath in expected_output_json_files:
-                with open(output_json_filepath) as output_json_fh:
-                    single_node_knime_output = json.load(output_json_fh)
-                knime_outputs.append(single_node_knime_output)
+            if len(expected_output_json_files) > 2:
+                # Overlap reading of the output files from disk; for just
+                # one or two outputs, a pool is not worth its setup cost.
+                with ThreadPoolExecutor(
+                        max_workers=min(len(expected_output_json_files), 8)
+                    ) as executor:
+                    knime_outputs = list(executor.map(
+                        load_output,
+                        expected_output_json_files
+                    ))
+            else:
+                knime_outputs = [
+                    load_output(output_json_filepath)
+                    for output_json_filepath in expected_output_json_files
+                ]
         except FileNotFoundError:
-            if result.stderr and KEYPHRASE_LOCKED in result.stderr:
-                raise ChildProcessError(KEYPHRASE_LOCKED.decode('utf8'))
+            captured_stderr = read_captured_output(stderr_filepath)
+            keyphrase_locked = KEYPHRASE_LOCKED.decode('utf8')
+            if captured_stderr and keyphrase_locked in captured_stderr:
+                raise ChildProcessError(keyphrase_locked)
 
-            try:
-                logging.error(f"captured stdout: {result.stdout.decode('utf8')}")
-                logging.error(f"captured stderr: {result.stderr.decode('utf8')}")
-            except:
-                logging.error(f"captured stdout: {result.stdout}")
-                logging.error(f"captured stderr: {result.stderr}")
+            logging.error(
+                f"captured stdout: {read_captured_output(stdout_filepath)}"
+            )
+            logging.error(f"captured stderr: {captured_stderr}")
             raise ChildProcessError("Output from KNIME not found")
+        except Exception as e:
+            if stream_outputs_to_dataframes:
+                # Outputs are converted to DataFrames as they are loaded.
+                logging.error("error while converting KNIME output to DataFrame")
+            raise e
 
-        if output_as_pandas_dataframes:
+        if output_as_pandas_dataframes and not stream_outputs_to_dataframes:
             try:
                 for i, output in enumerate(knime_outputs):
-                    df_columns = list(
-                        k for d in output['table-spec']
-                        for k, v in d.items()
-                    )
-                    knime_outputs[i] = pandas.DataFrame(
-                        output['table-data'],
-                        columns=df_columns
+                    knime_outputs[i] = convert_knime_output_to_dataframe(
+                        output
                     )
             except ImportError:
                 logging.warning("requested output as DataFrame not possible")
@@ -317,24 +862,30 @@ def run_workflow_using_multiple_service_tables(
 
         if result.returncode != 0:
             logging.warning("Return code from KNIME execution was non-zero")
-            logging.warning(f"captured stdout: {result.stdout}")
-            logging.warning(f"captured stderr: {result.stderr}")
+            logging.warning(
+                f"captured stdout: {read_captured_output(stdout_filepath)}"
+            )
+            logging.warning(
+                f"captured stderr: {read_captured_output(stderr_filepath)}"
+            )
 
     return knime_outputs
 
 
+# Matches both the definitions of and references to clipping path ids in
+# the SVGs produced by KNIME, as rewritten by LocalWorkflow._adjust_svg.
+svg_clip_id_regex = re.compile(r'(id="|#)clip')
+
+
 class Workflow:
     "Factory class for working with KNIME workflows; not for subclassing."
 
     def __new__(cls, workflow_path, *, workspace_path=None, **kwargs):
         if (
-                workflow_path.startswith(r"https://") or
-                workflow_path.startswith(r"http://") or
+                workflow_path.startswith(("https://", "http://")) or
                 (
-                    workspace_path is not None and (
-                        workspace_path.startswith(r"https://") or
-                        workspace_path.startswith(r"http://")
-                    )
+                    workspace_path is not None and
+                    workspace_path.startswith(("https://", "http://"))
                 )
            ):
             # URL for workflow on KNIME Server is handled by RemoteWorkflow
@@ -345,6 +896,59 @@ class Workflow:
         return cls(workflow_path, workspace_path=workspace_path, **kwargs)
 
 
+class BatchExecutorSession:
+    """Shares one KNIME workspace data directory across successive
+    executions of local workflows via KNIME's batch executor.
+
+    KNIME's batch executor runs a single workflow per invocation and so
+    each execution still starts its own KNIME process, but the workspace
+    need only be initialized by the first of them rather than by every
+    one.  Executions sharing a session are serialized because a workspace
+    may only be used by one KNIME instance at a time.  Supply a session
+    to a LocalWorkflow via its `session` parameter.
+    """
+
+    __slots__ = ("data_dir", "_temp_dir", "_lock")
+
+    def __init__(self):
+        self._temp_dir = None
+        self._lock = threading.Lock()
+        self.data_dir = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_inst, exc_tb):
+        self.close()
+        return False
+
+    def open(self):
+        "Creates the shared workspace data directory (if not already done)."
+        if self._temp_dir is None:
+            self._temp_dir = tempfile.TemporaryDirectory()
+            self.data_dir = Path(self._temp_dir.name, "knime_data")
+
+    def run_workflow_using_multiple_service_tables(self, *args, **kwargs):
+        """Same as the module-level function of the same name but executes
+        using this session's shared workspace data directory."""
+        with self._lock:
+            self.open()
+            return run_workflow_using_multiple_service_tables(
+                *args,
+                data_dir=self.data_dir,
+                **kwargs
+            )
+
+    def close(self):
+        "Removes the shared workspace data directory."
+        with self._lock:
+            if self._temp_dir is not None:
+                self._temp_dir.cleanup()
+                self._temp_dir = None
+                self.data_dir = None
+
+
 class LocalWorkflow:
     """Enables reading and executing of local KNIME workflows.
 
@@ -353,14 +957,19 @@ class LocalWorkflow:
     path.  Alternatively, a `workspace_path` that points to a KNIME
     workspace's location on disk may be provided so that the supplied
     `workflow_path` can instead be relative to the workspace's location.
+    A BatchExecutorSession may be supplied as `session` to share one
+    KNIME workspace data directory across successive executions.
     """
 
     __slots__ = ("_data_table_inputs", "_data_table_outputs",
             "_service_table_input_nodes", "_service_table_output_nodes",
-            "save_after_execution",
-            "path_to_knime_workflow", "_input_ids", "_output_ids")
+            "save_after_execution", "session", "_discovered",
+            "path_to_knime_workflow", "_input_ids", "_output_ids",
+            "_input_parameter_names",
+            "_workflow_svg", "_svg_prefix", "_adjusted_svg")
 
-    def __init__(self, workflow_path, *, workspace_path=None, save_after_execution=False):
+    def __init__(self, workflow_path, *, workspace_path=None, save_after_execution=False,
+                 session=None):
         if workspace_path is not None:
             try:
                 workflow_path_as_path = Path(workflow_path).relative_to("/")
@@ -372,10 +981,16 @@ class LocalWorkflow:
         else:
             self.path_to_knime_workflow = Path(workflow_path).resolve()
         self.save_after_execution = save_after_execution
+        self.session = session
+        self._discovered = False
         self._data_table_inputs = None
         self._data_table_outputs = None
         self._service_table_input_nodes = None
         self._service_table_output_nodes = None
+        self._input_parameter_names = None
+        self._workflow_svg = None
+        self._svg_prefix = None
+        self._adjusted_svg = None
 
     def __dir__(self):
         return [ a for a in dir(self.__class__) if a[0] != "_" or a[1] == "_" ]
@@ -388,27 +1003,44 @@ class LocalWorkflow:
         return False
 
     def _discover_inputoutput_nodes(self):
-        self._service_table_input_nodes, self._service_table_output_nodes = \
-            find_service_table_node_dirnames(self.path_to_knime_workflow)
+        if self._discovered:
+            return
+        (
+            self._service_table_input_nodes,
+            self._service_table_output_nodes,
+            self._input_parameter_names,
+        ) = find_service_table_nodes(self.path_to_knime_workflow)
+        node_ids = find_node_ids_cached(
+            self.path_to_knime_workflow,
+            self._service_table_input_nodes + self._service_table_output_nodes
+        )
         self._input_ids = [
-            find_node_id(self.path_to_knime_workflow, stin)
-            for stin in self._service_table_input_nodes
+            node_ids.get(stin) for stin in self._service_table_input_nodes
         ]
         self._output_ids = [
-            find_node_id(self.path_to_knime_workflow, stin)
-            for stin in self._service_table_output_nodes
+            node_ids.get(stin) for stin in self._service_table_output_nodes
         ]
         self._data_table_inputs = [None] * len(self._service_table_input_nodes)
         self._data_table_outputs = [None] * len(self._service_table_output_nodes)
+        self._discovered = True
 
     def execute(
             self,
             *,
             live_passthru_stdout_stderr=False,
             output_as_pandas_dataframes=True if pandas else False,
+            session=None,
         ):
-        "Executes the KNIME workflow via KNIME's batch executor."
-        outputs = run_workflow_using_multiple_service_tables(
+        """Executes the KNIME workflow via KNIME's batch executor.  A
+        BatchExecutorSession supplied as `session` is used for this
+        execution in place of any session given to the LocalWorkflow."""
+        if session is None:
+            session = self.session
+        if session is not None:
+            run_workflow = session.run_workflow_using_multiple_service_tables
+        else:
+            run_workflow = run_workflow_using_multiple_service_tables
+        outputs = run_workflow(
             self.data_table_inputs,
             executable_path,
             self.path_to_knime_workflow,
@@ -426,7 +1058,7 @@ class LocalWorkflow:
         in the KNIME workflow at time of execution.  Growing or shrinking this
         list from its original length is not supported.  This list is not
         guaranteed to persist after __exit__ is called."""
-        if self._service_table_input_nodes is None or self._data_table_inputs is None:
+        if not self._discovered:
             self._discover_inputoutput_nodes()
         return self._data_table_inputs
 
@@ -435,48 +1067,59 @@ class LocalWorkflow:
         """List of outputs produced from Container Output nodes in the KNIME
         workflow (populated only after execution).  This list is not
         guaranteed to persist after __exit__ is called."""
-        if self._service_table_output_nodes is None or self._data_table_outputs is None:
+        if not self._discovered:
             self._discover_inputoutput_nodes()
         return self._data_table_outputs
 
     @property
     def data_table_inputs_names(self):
         "View of which Container Input nodes go with which position in list."
-        if self._service_table_input_nodes is None:
+        if not self._discovered:
             self._discover_inputoutput_nodes()
         return tuple(self._service_table_input_nodes)
 
     @property
     def data_table_inputs_parameter_names(self):
-        if self._service_table_input_nodes is None:
+        if not self._discovered:
             self._discover_inputoutput_nodes()
         return tuple(
-            find_service_table_input_node_parameter_name(
-                self.path_to_knime_workflow,
-                unique_node_dirname
-            )
+            self._input_parameter_names[unique_node_dirname]
             for unique_node_dirname in self._service_table_input_nodes
         )
 
     def _get_workflow_svg(self):
-        with open(self.path_to_knime_workflow / "workflow.svg", 'r') as f:
-            svg_contents = f.read()
-        return svg_contents
+        svg_filepath = os.path.join(self.path_to_knime_workflow, "workflow.svg")
+        mtime_ns = os.stat(svg_filepath).st_mtime_ns
+        if self._workflow_svg is None or self._workflow_svg[0] != mtime_ns:
+            # Only re-read the file once it has been modified.
+            with open(svg_filepath, 'r') as f:
+                self._workflow_svg = (mtime_ns, f.read())
+        return self._workflow_svg[1]
 
     def _adjust_svg(self):
         """As of v3.6.0 the SVGs produced by KNIME all use the same ids for
         clipping paths. This leads to problems when we try and put multiple
         of them on the same page. Here we make those unique across SVGs until
-        hopefully KNIME updates its behavior.
+        hopefully KNIME updates its behavior.  The prefix used is fixed
+        per instance so that the adjusted SVG can be reused until the
+        workflow's SVG changes.
         """
-        import random
-        import string
-        chrs = string.ascii_letters + string.digits
-        prefix = "".join(random.choice(chrs) for i in range(10))
         svg_contents = self._get_workflow_svg()
-        svg_contents = svg_contents.replace('id="clip', 'id="l%sclip' % prefix)
-        svg_contents = svg_contents.replace('#clip', '#l%sclip' % prefix)
-        return svg_contents
+        if (
+                self._adjusted_svg is not None and
+                self._adjusted_svg[0] == svg_contents
+           ):
+            return self._adjusted_svg[1]
+        if self._svg_prefix is None:
+            import secrets
+            self._svg_prefix = secrets.token_hex(5)
+        prefix = self._svg_prefix
+        adjusted_svg_contents = svg_clip_id_regex.sub(
+            r'\g<1>l%sclip' % prefix,
+            svg_contents
+        )
+        self._adjusted_svg = (svg_contents, adjusted_svg_contents)
+        return adjusted_svg_contents
 
     def _repr_svg_(self):
         "Returns SVG of workflow for subsequent rendering in Jupyter notebook."
@@ -491,6 +1134,8 @@ class LocalWorkflow:
 class RemoteWorkflow(LocalWorkflow):
     "Enables reading and executing of remote KNIME workflows on a Server."
 
+    __slots__ = ("rest_api_root_url", "jwt", "_session", "_last_status_code")
+
     def __init__(self, workflow_path, *, workspace_path=None,
                  username=None, password=None,
                  server_base_path="/knime"):
@@ -509,21 +1154,35 @@ class RemoteWorkflow(LocalWorkflow):
         server_base_path = server_base_path.strip("/")
         self.rest_api_root_url = \
             f"{parsed_path.scheme}://{parsed_path.netloc}/{server_base_path}/rest/v4"
-        r = requests.get(
+        # A single Session keeps the connection to the server alive across
+        # the auth, discovery, execution, and image requests.
+        self._session = requests.Session()
+        r = self._session.get(
             f"{self.rest_api_root_url}/auth/jwt",
             auth=(username, password)
         )
         assert r.status_code == 200, "Authentication on KNIME Server failed"
         self._last_status_code = r.status_code
         self.jwt = r.text
+        self._session.headers.update({"Authorization": f"Bearer {self.jwt}"})
         self._data_table_inputs = None
         self._data_table_outputs = []
         self._service_table_input_nodes = None
+        self._discovered = False
+        self._workflow_svg = None
+        self._svg_prefix = None
+        self._adjusted_svg = None
+
+    def __exit__(self, exc_type, exc_inst, exc_tb):
+        # Releases the connection(s) pooled by the Session.
+        self._session.close()
+        return False
 
     def _discover_inputoutput_nodes(self):
-        r = requests.get(
-            f"{self.rest_api_root_url}/repository/{self.path_to_knime_workflow}:openapi",
-            headers={"Authorization": f"Bearer {self.jwt}"}
+        if self._discovered:
+            return
+        r = self._session.get(
+            f"{self.rest_api_root_url}/repository/{self.path_to_knime_workflow}:openapi"
         )
         self._last_status_code = r.status_code
         if r.status_code != 200:
@@ -544,6 +1203,7 @@ class RemoteWorkflow(LocalWorkflow):
         except KeyError:
             self._service_table_input_nodes = []
         self._data_table_inputs = [None] * len(self._service_table_input_nodes)
+        self._discovered = True
 
     @property
     def data_table_inputs(self):
@@ -551,16 +1211,13 @@ class RemoteWorkflow(LocalWorkflow):
         in the KNIME workflow at time of execution.  Growing or shrinking this
         list from its original length is not supported.  This list is not
         guaranteed to persist after __exit__ is called."""
-        if (
-                self._service_table_input_nodes is None or
-                self._data_table_inputs is None
-           ):
+        if not self._discovered:
             self._discover_inputoutput_nodes()
         return self._data_table_inputs
 
     @property
     def data_table_inputs_parameter_names(self):
-        if self._service_table_input_nodes is None:
+        if not self._discovered:
             self._discover_inputoutput_nodes()
         parameter_names = tuple(
             val.rsplit("-", 1)[0] for val in self._service_table_input_nodes
@@ -591,12 +1248,11 @@ class RemoteWorkflow(LocalWorkflow):
         if reset:
             job_params["reset"] = bool(reset)
 
-        r = requests.post(
+        r = self._session.post(
             f"{self.rest_api_root_url}/repository/{self.path_to_knime_workflow}:execution",
-            json=job_input_data,
+            data=dumps_json_as_bytes(job_input_data),
             params=job_params,
             headers={
-                "Authorization": f"Bearer {self.jwt}",
                 "Content-Type": "application/json",
                 "Accept": "application/vnd.mason+json",
             }
@@ -611,20 +1267,13 @@ class RemoteWorkflow(LocalWorkflow):
                 f"Server response status code {r.status_code}: {r.text}"
             )
 
-        rest_service_output = r.json()
+        rest_service_output = loads_json_from_bytes(r.content)
         knime_outputs = []
         if output_as_pandas_dataframes:
             try:
                 for output in rest_service_output["outputValues"].values():
-                    df_columns = list(
-                        k for d in output['table-spec']
-                        for k, v in d.items()
-                    )
                     knime_outputs.append(
-                        pandas.DataFrame(
-                            output['table-data'],
-                            columns=df_columns
-                        )
+                        convert_knime_output_to_dataframe(output)
                     )
             except ImportError:
                 logging.warning("requested output as DataFrame not possible")
@@ -643,9 +1292,8 @@ class RemoteWorkflow(LocalWorkflow):
         self._data_table_outputs[:] = knime_outputs
 
     def _get_workflow_svg(self):
-        r = requests.get(
-            f"{self.rest_api_root_url}/repository/{self.path_to_knime_workflow}:image",
-            headers={"Authorization": f"Bearer {self.jwt}"}
+        r = self._session.get(
+            f"{self.rest_api_root_url}/repository/{self.path_to_knime_workflow}:image"
         )
         self._last_status_code = r.status_code
         if r.status_code != 200:
@@ -1,11 +1,14 @@
-import io
 import hashlib
 import logging
+from operator import itemgetter
 import os
+import shutil
 import sys
+import tempfile
 import threading
 import time
 import unittest
+from unittest import mock
 import warnings
 try:
     import pandas as pd
@@ -18,6 +21,20 @@ import knime
 del sys.path[0]
 
 
+# Digest of the test workflow's .savedWithData file as it is checked in,
+# i.e. before any execution which saves the workflow.
+UNSAVED_WORKFLOW_MD5 = "ac23b46d2e75be6a9ce5f479104de658"
+
+
+def md5_hexdigest_of_file(filepath):
+    "Returns the md5 hex digest of a file's contents, read in chunks."
+    md5 = hashlib.md5()
+    with open(filepath, "rb") as fp:
+        for chunk in iter(lambda: fp.read(65536), b""):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
 class CoreFunctionsTest(unittest.TestCase):
     default_container_input_table_columns = [
         "column-string",
@@ -29,18 +46,41 @@ class CoreFunctionsTest(unittest.TestCase):
         "column-localdatetime",
         "column-zoneddatetime",
     ]
+    default_output_table_columns = frozenset(
+        default_container_input_table_columns + ["computored"]
+    )
+    # Fragile:  assumes 64-bit system used in testing.
+    default_output_dtypes = None if pd is None else [
+        np.dtype("O"),
+        np.dtype("int64"),
+        np.dtype("float64"),
+        np.dtype("int64"),
+        np.dtype("bool"),
+        np.dtype("O"),
+        np.dtype("O"),
+        np.dtype("O"),
+        np.dtype("int64"),
+    ]
 
     simple_input_data_table_dict = {
         "table-spec": [{"column-int": "int"}, {"b": "string"}],
         "table-data": [[100, "boil"], [0, "freeze"]]
     }
 
-    @staticmethod
+    @classmethod
+    def setUpClass(cls):
+        # Resolved once for all tests which use this workflow.
+        cls.simple_workflow_path = os.path.abspath(
+            "tests/knime-workspace/test_simple_container_table_01"
+        )
+
+    @classmethod
     def templated_test_container_1_input_1_output(
+            cls,
             input_data_table=None,
             output_as_pandas_dataframes=None
         ):
-        with knime.Workflow("tests/knime-workspace/test_simple_container_table_01") as wf:
+        with knime.Workflow(cls.simple_workflow_path) as wf:
             if input_data_table is not None:
                 wf.data_table_inputs[0] = input_data_table
             if output_as_pandas_dataframes is not None:
@@ -59,11 +99,11 @@ class CoreFunctionsTest(unittest.TestCase):
         )
         self.assertEqual(len(results), 1)
         self.assertTrue(isinstance(results[0], dict))
-        returned_table_spec = (list(d)[0] for d in results[0]["table-spec"])
-        self.assertEqual(set(returned_table_spec), {"column-int", "b", "computored"})
-        returned_computored_values = [
-            row[2] for row in results[0]["table-data"]
-        ]
+        returned_table_spec = (next(iter(d)) for d in results[0]["table-spec"])
+        self.assertCountEqual(returned_table_spec, ("column-int", "b", "computored"))
+        returned_computored_values = list(
+            map(itemgetter(2), results[0]["table-data"])
+        )
         self.assertEqual(returned_computored_values, [4200, 0])
 
 
@@ -107,7 +147,7 @@ class CoreFunctionsTest(unittest.TestCase):
         )
         self.assertEqual(len(results), 1)
         self.assertTrue(isinstance(results[0], pd.DataFrame))
-        self.assertEqual(set(results[0].columns), {"column-int", "b", "computored"})
+        self.assertCountEqual(results[0].columns, ("column-int", "b", "computored"))
         self.assertEqual(
             list(results[0]["computored"].values),
             [4200, 0]
@@ -117,19 +157,19 @@ class CoreFunctionsTest(unittest.TestCase):
     def test_container_1_input_1_output_DataFrame_input(self):
         if pd is None:
             self.skipTest("pandas not available")
-        df = pd.DataFrame(
-            [[0, "cold", 3.14], [15, "warm", np.NaN], [30, "hot", -1.0]],
-            columns=["column-int", "description", "showcase_missing_val"]
-        )
-        df["column-int"] = df["column-int"].astype(np.int32)
+        df = pd.DataFrame({
+            "column-int": np.array([0, 15, 30], dtype=np.int32),
+            "description": ["cold", "warm", "hot"],
+            "showcase_missing_val": np.array([3.14, np.nan, -1.0]),
+        })
         results = self.templated_test_container_1_input_1_output(
             input_data_table=df,
         )
         self.assertEqual(len(results), 1)
         self.assertTrue(isinstance(results[0], pd.DataFrame))
-        self.assertEqual(
-            set(results[0].columns),
-            {"column-int", "description", "showcase_missing_val", "computored"}
+        self.assertCountEqual(
+            results[0].columns,
+            ("column-int", "description", "showcase_missing_val", "computored")
         )
         self.assertEqual(
             list(results[0]["computored"].values),
@@ -142,25 +182,24 @@ class CoreFunctionsTest(unittest.TestCase):
     def test_container_1_input_1_output_DataFrame_input_no_DataFrame_output(self):
         if pd is None:
             self.skipTest("pandas not available")
-        df = pd.DataFrame(
-            [[-1, "cold"], [15, "warm"], [30, "hot"]],
-            columns=["column-int", "description"]
-        )
-        df["column-int"] = df["column-int"].astype(np.int32)
+        df = pd.DataFrame({
+            "column-int": np.array([-1, 15, 30], dtype=np.int32),
+            "description": ["cold", "warm", "hot"],
+        })
         results = self.templated_test_container_1_input_1_output(
             input_data_table=df,
             output_as_pandas_dataframes=False,
         )
         self.assertEqual(len(results), 1)
         self.assertTrue(isinstance(results[0], dict))
-        returned_table_spec = (list(d)[0] for d in results[0]["table-spec"])
-        self.assertEqual(
-            set(returned_table_spec),
-            {"column-int", "description", "computored"}
+        returned_table_spec = (next(iter(d)) for d in results[0]["table-spec"])
+        self.assertCountEqual(
+            returned_table_spec,
+            ("column-int", "description", "computored")
+        )
+        returned_computored_values = list(
+            map(itemgetter(2), results[0]["table-data"])
         )
-        returned_computored_values = [
-            row[2] for row in results[0]["table-data"]
-        ]
         self.assertEqual(returned_computored_values, [-42, 630, 1260])
 
 
@@ -171,10 +210,10 @@ class CoreFunctionsTest(unittest.TestCase):
             )
         self.assertEqual(len(results), 1)
         self.assertTrue(isinstance(results[0], dict))
-        returned_table_spec = (list(d)[0] for d in results[0]["table-spec"])
-        self.assertEqual(
-            set(returned_table_spec),
-            set(self.default_container_input_table_columns + ["computored"])
+        returned_table_spec = (next(iter(d)) for d in results[0]["table-spec"])
+        self.assertCountEqual(
+            returned_table_spec,
+            self.default_output_table_columns
         )
 
 
@@ -200,71 +239,35 @@ class CoreFunctionsTest(unittest.TestCase):
         self.assertEqual(len(results), 1)
         df = results[0]
         self.assertTrue(isinstance(df, pd.DataFrame))
-        self.assertEqual(
-            set(df.columns),
-            set(self.default_container_input_table_columns + ["computored"])
-        )
+        self.assertCountEqual(df.columns, self.default_output_table_columns)
         # Test breadth of coverage of type conversions on return.
-        # Fragile test:  assumes 64-bit system used in testing.
-        self.assertEqual(
-            list(df.dtypes),
-            [
-                np.dtype("O"),
-                np.dtype("int64"),
-                np.dtype("float64"),
-                np.dtype("int64"),
-                np.dtype("bool"),
-                np.dtype("O"),
-                np.dtype("O"),
-                np.dtype("O"),
-                np.dtype("int64"),
-            ]
-        )
+        self.assertEqual(list(df.dtypes), self.default_output_dtypes)
 
 
     def test_container_1_input_1_output_inappropriate_input_data(self):
-        logger = logging.getLogger()
-
-        # Remove current log handlers.
-        logging_handlers = logger.handlers[:]
-        for lh in logging_handlers:
-            logger.removeHandler(lh)
-
-        # Add our own temporary log handler.
-        log_buffer = io.StringIO()
-        temp_lh = logging.StreamHandler(log_buffer)
-        logger.addHandler(temp_lh)
-
         inappropriate_input_data_table_dict = {
             "table-spec": [{"columnZZZint": "int"}, {"bZZZ": "string"}],
             "table-data": [[101, "boil"], [-10, "freeze"]]
         }
 
-        with self.assertRaises(ChildProcessError):
-            results = self.templated_test_container_1_input_1_output(
-                input_data_table=inappropriate_input_data_table_dict,
-                output_as_pandas_dataframes=False,
-            )
-
-        log_buffer.seek(0)
-        raw_log_lines = log_buffer.readlines()
+        with self.assertLogs(level=logging.WARNING) as cm:
+            with self.assertRaises(ChildProcessError):
+                results = self.templated_test_container_1_input_1_output(
+                    input_data_table=inappropriate_input_data_table_dict,
+                    output_as_pandas_dataframes=False,
+                )
 
-        # Restore original log handlers.
-        logger.removeHandler(temp_lh)
-        for lh in logging_handlers:
-            logger.addHandler(lh)
+        log_messages = [record.getMessage() for record in cm.records]
+        log_text = "\n".join(log_messages)
+        first_log_line = log_text.partition("\n")[0]
 
         # Verify relevant available info sent to logging.
-        self.assertTrue("captured stdout" in raw_log_lines[0])
+        self.assertTrue("captured stdout" in first_log_line)
         self.assertTrue(
-            len(
-                list(
-                    l for l in raw_log_lines if l.startswith("captured stderr")
-                )
-            )
+            any(m.startswith("captured stderr") for m in log_messages)
         )
-        self.assertTrue(len(raw_log_lines[0]) > 25)
-        self.assertTrue(len(raw_log_lines) > 25)
+        self.assertTrue(len(first_log_line) > 25)
+        self.assertTrue(log_text.count("\n") + 1 > 25)
 
 
     def test_container_1_input_1_output_mismatched_input_datatypes(self):
@@ -358,35 +361,236 @@ class CoreFunctionsTest(unittest.TestCase):
                 results = wf.data_table_outputs[:]
 
 
+    def test_batch_executor_session_shared_across_executions(self):
+        with knime.BatchExecutorSession() as session:
+            for _ in range(2):
+                with knime.Workflow(
+                    self.simple_workflow_path,
+                    session=session
+                ) as wf:
+                    wf.data_table_inputs[0] = self.simple_input_data_table_dict
+                    wf.execute(output_as_pandas_dataframes=False)
+                    results = wf.data_table_outputs[:]
+                self.assertEqual(len(results), 1)
+                self.assertTrue(session.data_dir.exists())
+            data_dir = session.data_dir
+        self.assertIsNone(session.data_dir)
+        self.assertFalse(data_dir.exists())
+
+
     def test_obtain_local_workflow_svg(self):
-        wf = knime.Workflow("tests/knime-workspace/test_simple_container_table_01")
+        wf = knime.Workflow(self.simple_workflow_path)
         image = wf._adjust_svg()
         self.assertTrue("clip" in image)
+        self.assertEqual(wf._repr_svg_(), image)
+        other_wf = knime.Workflow(self.simple_workflow_path)
+        self.assertNotEqual(other_wf._adjust_svg(), image)
 
 
     def test_AAAA_nosave_workflow_after_execution_as_default(self):
-        with knime.Workflow("tests/knime-workspace/test_simple_container_table_01") as wf:
+        with knime.Workflow(self.simple_workflow_path) as wf:
             with self.assertWarns(UserWarning):
                 wf.execute(output_as_pandas_dataframes=False)
             results = wf.data_table_outputs[:]
             self.assertEqual(wf.data_table_inputs_parameter_names, ("input",))
 
-        with open(wf.path_to_knime_workflow / ".savedWithData") as fp:
-            contents_hash = hashlib.md5(fp.read().encode('utf8')).hexdigest()
-        self.assertEqual(contents_hash, "ac23b46d2e75be6a9ce5f479104de658")
+        contents_hash = md5_hexdigest_of_file(
+            wf.path_to_knime_workflow / ".savedWithData"
+        )
+        self.assertEqual(contents_hash, UNSAVED_WORKFLOW_MD5)
 
 
     def test_zzzz_save_workflow_after_execution(self):
-        with knime.Workflow("tests/knime-workspace/test_simple_container_table_01") as wf:
+        # Saving modifies the workflow, so a copy of it is executed instead
+        # to leave the original untouched for the other tests.
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        workflow_path = shutil.copytree(
+            self.simple_workflow_path,
+            os.path.join(temp_dir.name, "test_simple_container_table_01")
+        )
+        with knime.Workflow(workflow_path) as wf:
             wf.save_after_execution = True
             with self.assertWarns(UserWarning):
                 wf.execute(output_as_pandas_dataframes=False)
             results = wf.data_table_outputs[:]
             self.assertEqual(wf.data_table_inputs_parameter_names, ("input",))
 
-        with open(wf.path_to_knime_workflow / ".savedWithData") as fp:
-            contents_hash = hashlib.md5(fp.read().encode('utf8')).hexdigest()
-        self.assertNotEqual(contents_hash, "ac23b46d2e75be6a9ce5f479104de658")
+        contents_hash = md5_hexdigest_of_file(
+            wf.path_to_knime_workflow / ".savedWithData"
+        )
+        self.assertNotEqual(contents_hash, UNSAVED_WORKFLOW_MD5)
+
+
+
+class DataConversionTest(unittest.TestCase):
+    "Conversions of data to and from KNIME's json; no KNIME required."
+
+    # Straddle the boundaries between chunks of rows when writing json.
+    chunked_num_rows = (
+        0,
+        1,
+        knime.JSON_CHUNK_NUM_ROWS - 1,
+        knime.JSON_CHUNK_NUM_ROWS,
+        knime.JSON_CHUNK_NUM_ROWS + 1,
+        2 * knime.JSON_CHUNK_NUM_ROWS,
+        2 * knime.JSON_CHUNK_NUM_ROWS + 1,
+    )
+
+    def write_and_load_knime_friendly_json(self, data):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        json_filepath = os.path.join(temp_dir.name, "input.json")
+        knime.write_knime_friendly_json(data, json_filepath)
+        return knime.load_json_file(json_filepath)
+
+    def test_write_dict_input_in_chunks(self):
+        for orjson in (knime.orjson, None):
+            for num_rows in self.chunked_num_rows:
+                with self.subTest(orjson=orjson, num_rows=num_rows), \
+                        mock.patch.object(knime, "orjson", orjson):
+                    data = {
+                        "table-spec": [{"column-int": "int"}, {"b": "string"}],
+                        "table-data": [[i, f"row {i}"] for i in range(num_rows)],
+                    }
+                    self.assertEqual(
+                        self.write_and_load_knime_friendly_json(data),
+                        data
+                    )
+
+    def test_write_DataFrame_input_in_chunks(self):
+        if pd is None:
+            self.skipTest("pandas not available")
+        for orjson in (knime.orjson, None):
+            for num_rows in self.chunked_num_rows:
+                with self.subTest(orjson=orjson, num_rows=num_rows), \
+                        mock.patch.object(knime, "orjson", orjson):
+                    df = pd.DataFrame({
+                        "column-int": np.arange(num_rows, dtype=np.int32),
+                        "description": [f"row {i}" for i in range(num_rows)],
+                        "showcase_missing_val": np.where(
+                            np.arange(num_rows) % 3, 0.5, np.nan
+                        ),
+                    })
+                    self.assertEqual(
+                        self.write_and_load_knime_friendly_json(df),
+                        knime.convert_dataframe_to_knime_friendly_dict(df)
+                    )
+
+    def test_DataFrame_input_left_unmodified(self):
+        if pd is None:
+            self.skipTest("pandas not available")
+        df = pd.DataFrame({
+            "mixed": pd.Series([None, 1, "two"], dtype=object),
+            "temp": [-273.15, np.nan, 100.0],
+        })
+        original_df = df.copy()
+        data = knime.convert_dataframe_to_knime_friendly_dict(df)
+        self.write_and_load_knime_friendly_json(df)
+        self.assertEqual(
+            data["table-data"],
+            [["None", -273.15], ["1", None], ["two", 100.0]]
+        )
+        pd.testing.assert_frame_equal(df, original_df)
+        self.assertIsNone(df["mixed"][0])
+
+    def test_output_values_not_coerced_to_declared_type(self):
+        if pd is None:
+            self.skipTest("pandas not available")
+        output = {
+            "table-spec": [
+                {"flag": "boolean"},
+                {"count": "long"},
+                {"measure": "double"},
+                {"ratio": "double"},
+                {"small": "int"},
+                {"valid": "boolean"},
+                {"sparse": "long"},
+                {"huge": "long"},
+            ],
+            "table-data": [
+                ["false", 1.7, 1, 1.5, 3, True, None, 2**70],
+                ["true", 2, 2, 2.5, 4, False, 5, 1],
+            ],
+        }
+        df = knime.convert_knime_output_to_dataframe(output)
+        self.assertEqual(list(df["flag"]), ["false", "true"])
+        self.assertEqual(list(df["count"]), [1.7, 2])
+        self.assertEqual(df["measure"].dtype, np.dtype("int64"))
+        self.assertEqual(df["ratio"].dtype, np.dtype("float64"))
+        self.assertEqual(df["small"].dtype, np.dtype("int64"))
+        self.assertEqual(df["valid"].dtype, np.dtype("bool"))
+        self.assertEqual(list(df["huge"]), [2**70, 1])
+        # Same as pandas would produce from the rows themselves.
+        expected_df = pd.DataFrame(
+            output["table-data"],
+            columns=[next(iter(d)) for d in output["table-spec"]]
+        )
+        pd.testing.assert_frame_equal(df, expected_df)
+
+    def test_streamed_output_matches_loaded_output(self):
+        if pd is None or knime.ijson is None:
+            self.skipTest("pandas or ijson not available")
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        json_filepath = os.path.join(temp_dir.name, "output.json")
+        for table_data in ([], [["boil", 100, 1.5, None], ["freeze", 0, 2.0, 7]]):
+            with self.subTest(num_rows=len(table_data)):
+                output = {
+                    "table-spec": [
+                        {"b": "string"},
+                        {"column-int": "int"},
+                        {"column-double": "double"},
+                        {"column-long": "long"},
+                    ],
+                    "table-data": table_data,
+                }
+                with open(json_filepath, "wb") as json_fh:
+                    json_fh.write(knime.dumps_json_as_bytes(output))
+                pd.testing.assert_frame_equal(
+                    knime.load_knime_output_file_as_dataframe(json_filepath),
+                    knime.convert_knime_output_to_dataframe(output)
+                )
+
+    def test_pandas_dtype_to_knime_type(self):
+        if pd is None:
+            self.skipTest("pandas not available")
+        expected_knime_types = {
+            "float32": "double",
+            "float64": "double",
+            "Float64": "double",
+            "int8": "int",
+            "int16": "int",
+            "int32": "int",
+            "int64": "long",
+            "Int32": "int",
+            "Int64": "long",
+            "uint8": "int",
+            "uint16": "int",
+            "uint32": "long",
+            "uint64": "long",
+            "bool": "boolean",
+            "boolean": "boolean",
+            "datetime64[ns]": "string",
+            "category": "string",
+            "object": "string",
+        }
+        for dtype_name, expected_knime_type in expected_knime_types.items():
+            with self.subTest(dtype=dtype_name):
+                dtype = pd.Series([], dtype=dtype_name).dtype
+                self.assertEqual(
+                    knime.pandas_type_mapper(dtype),
+                    expected_knime_type
+                )
+
+    def test_nullable_int_input_conveyed_as_long_with_nulls(self):
+        if pd is None:
+            self.skipTest("pandas not available")
+        df = pd.DataFrame({"count": pd.array([1, None], dtype="Int64")})
+        self.assertEqual(
+            knime.convert_dataframe_to_knime_friendly_dict(df),
+            {"table-spec": [{"count": "long"}], "table-data": [[1], [None]]}
+        )
 
 
 
@@ -21,12 +21,26 @@ del sys.path[0]
 class RemoteWorkflowsTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        cls.knime_server_urlroot = os.getenv("KNIME_SERVER_URLROOT")
-        cls.knime_server_username = os.getenv("KNIME_SERVER_USER")
-        cls.knime_server_password = os.getenv("KNIME_SERVER_PASS")
-        cls.knime_server_testdir = os.getenv(
-            "KNIME_SERVER_TESTDIR",
-            f"/Users/{cls.knime_server_username}"
+        env = os.environ
+        cls.knime_server_urlroot = env.get("KNIME_SERVER_URLROOT")
+        cls.knime_server_username = env.get("KNIME_SERVER_USER")
+        cls.knime_server_password = env.get("KNIME_SERVER_PASS")
+        if not (
+                cls.knime_server_urlroot and
+                cls.knime_server_username and
+                cls.knime_server_password
+           ):
+            raise unittest.SkipTest(
+                "KNIME_SERVER_URLROOT, KNIME_SERVER_USER and "
+                "KNIME_SERVER_PASS must be set to test against a KNIME Server"
+            )
+        cls.knime_server_testdir = env.get("KNIME_SERVER_TESTDIR")
+        if cls.knime_server_testdir is None:
+            cls.knime_server_testdir = f"/Users/{cls.knime_server_username}"
+        cls.test_workflow_path = f"{cls.knime_server_testdir}/test20190410"
+        cls.quick_ip_address_url_via_webportal = (
+            f"{cls.knime_server_urlroot}/#/"
+            f"{cls.knime_server_testdir.strip('/')}/quick_ip_address"
         )
 
 
@@ -37,7 +51,7 @@ class RemoteWorkflowsTest(unittest.TestCase):
                         columns=['colors', 'vote']
         )
         workspace_path = self.knime_server_urlroot
-        workflow_path = f"{self.knime_server_testdir}/test20190410"
+        workflow_path = self.test_workflow_path
         with knime.Workflow(
             workspace_path=workspace_path,
             workflow_path=workflow_path,
@@ -58,7 +72,7 @@ class RemoteWorkflowsTest(unittest.TestCase):
             'table-data': [['blau', 42], ['gelb', -1]]
         }
         workspace_path = self.knime_server_urlroot
-        workflow_path = f"{self.knime_server_testdir}/test20190410"
+        workflow_path = self.test_workflow_path
         with knime.Workflow(
             workspace_path=workspace_path,
             workflow_path=workflow_path,
@@ -79,7 +93,7 @@ class RemoteWorkflowsTest(unittest.TestCase):
 
     def test_basic_remote_workflow_execution_missing_input(self):
         workspace_path = self.knime_server_urlroot
-        workflow_path = f"{self.knime_server_testdir}/test20190410"
+        workflow_path = self.test_workflow_path
         # This workflow will return the default table from Container Input
         # when no input data is otherwise supplied.
         with knime.Workflow(
@@ -100,7 +114,7 @@ class RemoteWorkflowsTest(unittest.TestCase):
 
     def test_obtain_remote_workflow_svg(self):
         workspace_path = self.knime_server_urlroot
-        workflow_path = f"{self.knime_server_testdir}/test20190410"
+        workflow_path = self.test_workflow_path
         wf = knime.Workflow(
             workspace_path=workspace_path,
             workflow_path=workflow_path,
@@ -136,7 +150,7 @@ class RemoteWorkflowsTest(unittest.TestCase):
             'table-data': [['blau', 42.7], ['gelb', -1.1]]
         }
         workspace_path = self.knime_server_urlroot
-        workflow_path = f"{self.knime_server_testdir}/test20190410"
+        workflow_path = self.test_workflow_path
         with self.assertLogs(level=ERROR):
             with self.assertRaises(RuntimeError):
                 with knime.Workflow(
@@ -153,10 +167,8 @@ class RemoteWorkflowsTest(unittest.TestCase):
         self.assertEqual(wf._last_status_code, 504)
 
     def test_no_inputs_remote_workflow_execution(self):
-        workflow_url_via_webportal = \
-            f"{self.knime_server_urlroot}/#/{self.knime_server_testdir.strip('/')}/quick_ip_address"
         with knime.Workflow(
-            workflow_url_via_webportal,  # Verify webportal-style urls work.
+            self.quick_ip_address_url_via_webportal,  # Verify webportal-style urls work.
             username=self.knime_server_username,
             password=self.knime_server_password
         ) as wf: